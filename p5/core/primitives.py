@@ -16,7 +16,9 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
 
-import math
+import functools
+
+import numpy as np
 
 from ..pmath import Point
 from ..pmath import curves
@@ -28,11 +30,95 @@ from . import p5
 
 __all__ = ['point', 'line', 'arc', 'triangle', 'quad',
            'rect', 'square', 'circle', 'ellipse', 'ellipse_mode',
-           'rect_mode', 'bezier', 'curve', 'create_shape']
+           'rect_mode', 'bezier', 'curve', 'create_shape',
+           'line_pp', 'triangle_ppp', 'quad_pppp', 'bezier_pppp',
+           'curve_pppp']
 
 _rect_mode = 'CORNER'
 _ellipse_mode = 'CENTER'
 
+# Coefficients of the cubic Bernstein polynomials in the power basis
+# [1, t, t^2, t^3]. Together with the curve basis matrix this lets us
+# evaluate every point along a curve with a single matrix product.
+_BEZIER_BASIS_MATRIX = np.array([
+    [1, 0, 0, 0],
+    [-3, 3, 0, 0],
+    [3, -6, 3, 0],
+    [-1, 3, -3, 1]
+])
+
+# How a point is drawn for each stroke cap.
+_POINT_HANDLERS = {
+    SQUARE: lambda coordinate, weight: None,
+    PROJECT: lambda coordinate, weight: square(coordinate, weight, mode='CENTER'),
+    ROUND: lambda coordinate, weight: circle(coordinate, weight / 2, mode='CENTER'),
+}
+
+# Split the arguments of quad() into its four points, by the number
+# of arguments.
+_QUAD_ARGS = {
+    8: lambda args: (args[:2], args[2:4], args[4:6], args[6:]),
+    4: lambda args: args,
+}
+
+# Split the arguments of rect() into the coordinate and the remaining
+# mode dependent arguments, by the number of arguments.
+_RECT_ARGS = {
+    4: lambda args: (args[:2], args[2:]),
+    3: lambda args: (args[0], args[1:]),
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _bezier_basis(steps):
+    """Return the (steps + 1, 4) matrix of Bernstein polynomials
+    evaluated at `steps + 1` evenly spaced parameters.
+    """
+    ts = np.linspace(0, 1, steps + 1)
+    basis = np.stack([np.ones_like(ts), ts, ts ** 2, ts ** 3], axis=1)
+    basis = basis @ _BEZIER_BASIS_MATRIX
+    basis.flags.writeable = False
+    return basis
+
+
+@functools.lru_cache(maxsize=8)
+def _curve_basis(steps, basis_matrix):
+    """Return the (steps + 1, 4) matrix of Catmull-Rom blending
+    functions evaluated at `steps + 1` evenly spaced parameters.
+
+    The curve basis matrix is passed as a tuple of rows so that it can
+    be part of the cache key.
+    """
+    ts = np.linspace(0, 1, steps + 1)
+    basis = np.stack([ts ** 3, ts ** 2, ts, np.ones_like(ts)], axis=1)
+    basis = basis @ np.array(basis_matrix)
+    basis.flags.writeable = False
+    return basis
+
+
+def _pack_points(*points):
+    """Pack the given 2D or 3D points into a vertex array.
+
+    In 2D sketches the vertices stay two dimensional when none of the
+    points has a z-coordinate. Otherwise the missing z-coordinates are
+    set to 0.
+
+    :returns: An (N, 2) or (N, 3) vertex array.
+    :rtype: np.ndarray
+    """
+    try:
+        if p5.mode == 'P2D' or len(points[0]) == 3:
+            return np.array(points, dtype=np.float32)
+        vertices = np.zeros((len(points), 3), dtype=np.float32)
+        vertices[:, :2] = points
+        return vertices
+    except ValueError:
+        # A mix of 2D and 3D points, pad the 2D ones.
+        vertices = np.zeros((len(points), 3), dtype=np.float32)
+        for vertex, pt in zip(vertices, points):
+            vertex[:len(pt)] = pt
+        return vertices
+
 
 def point(x, y, z=0):
     """Returns a point.
@@ -50,13 +136,11 @@ def point(x, y, z=0):
     :rtype: PShape
 
     """
-    if p5.renderer.stroke_cap == SQUARE:
-        pass
-    elif p5.renderer.stroke_cap == PROJECT:
-        return square((x, y, z), p5.renderer.stroke_weight, mode='CENTER')
-    elif p5.renderer.stroke_cap == ROUND:
-        return circle((x, y, z), p5.renderer.stroke_weight / 2, mode='CENTER')
-    raise ValueError('Unknown stroke_cap value')
+    handler = _POINT_HANDLERS.get(p5.renderer.stroke_cap)
+    if handler is None:
+        raise ValueError('Unknown stroke_cap value')
+    coordinate = (x, y, z) if z else (x, y)
+    return handler(coordinate, p5.renderer.stroke_weight)
 
 
 def line(*args):
@@ -99,11 +183,23 @@ def line(*args):
     else:
         raise ValueError("Unexpected number of arguments passed to line()")
 
-    path = [
-        Point(*p1),
-        Point(*p2)
-    ]
-    p5.renderer.line(path)
+    line_pp(p1, p2)
+
+
+def line_pp(p1, p2):
+    """Draw a line between two points.
+
+    This skips the argument handling of :func:`line` and can be called
+    directly when the points are already available.
+
+    :param p1: Coordinates of the starting point of the line.
+    :type p1: tuple
+
+    :param p2: Coordinates of the end point of the line.
+    :type p2: tuple
+
+    """
+    p5.renderer.line(_pack_points(p1, p2))
 
 
 def bezier(*args):
@@ -172,15 +268,32 @@ def bezier(*args):
     else:
         raise ValueError("Unexpected number of arguments passed to bezier()")
 
-    vertices = []
-    steps = curves.bezier_resolution
-    for i in range(steps + 1):
-        t = i / steps
-        p = curves.bezier_point(start, control_point_1,
-                                control_point_2, stop, t)
-        vertices.append(p[:3])
+    bezier_pppp(start, control_point_1, control_point_2, stop)
+
+
+def bezier_pppp(start, control_point_1, control_point_2, stop):
+    """Draw a bezier path given its anchor and control points.
+
+    This skips the argument handling of :func:`bezier` and can be
+    called directly when the points are already available.
 
-    p5.renderer.bezier(vertices)
+    :param start: The starting point of the bezier curve.
+    :type start: tuple.
+
+    :param control_point_1: The first control point of the bezier
+        curve.
+    :type control_point_1: tuple.
+
+    :param control_point_2: The second control point of the bezier
+        curve.
+    :type control_point_2: tuple.
+
+    :param stop: The end point of the bezier curve.
+    :type stop: tuple.
+
+    """
+    points = _pack_points(start, control_point_1, control_point_2, stop)
+    p5.renderer.bezier(_bezier_basis(curves.bezier_resolution) @ points)
 
 
 def curve(*args):
@@ -249,14 +362,32 @@ def curve(*args):
     else:
         raise ValueError("Unexpected number of arguments passed to curve()")
 
-    vertices = []
-    steps = curves.curve_resolution
-    for i in range(steps + 1):
-        t = i / steps
-        p = curves.curve_point(point_1, point_2, point_3, point_4, t)
-        vertices.append(p[:3])
+    curve_pppp(point_1, point_2, point_3, point_4)
+
+
+def curve_pppp(point_1, point_2, point_3, point_4):
+    """Draw a Catmull-Rom curve given its four points.
+
+    This skips the argument handling of :func:`curve` and can be called
+    directly when the points are already available.
+
+    :param point_1: The first point of the curve.
+    :type point_1: tuple
+
+    :param point_2: The second point of the curve.
+    :type point_2: tuple
+
+    :param point_3: The third point of the curve.
+    :type point_3: tuple
+
+    :param point_4: The fourth point of the curve.
+    :type point_4: tuple
 
-    p5.renderer.curve(vertices)
+    """
+    points = _pack_points(point_1, point_2, point_3, point_4)
+    basis_matrix = tuple(map(tuple, curves.curve_basis_matrix))
+    basis = _curve_basis(curves.curve_resolution, basis_matrix)
+    p5.renderer.curve(basis @ points)
 
 
 def triangle(*args):
@@ -299,12 +430,26 @@ def triangle(*args):
     else:
         raise ValueError("Unexpected number of arguments passed to triangle()")
 
-    path = [
-        Point(*p1),
-        Point(*p2),
-        Point(*p3)
-    ]
-    p5.renderer.triangle(path)
+    triangle_ppp(p1, p2, p3)
+
+
+def triangle_ppp(p1, p2, p3):
+    """Draw a triangle given its three corners.
+
+    This skips the argument handling of :func:`triangle` and can be
+    called directly when the points are already available.
+
+    :param p1: coordinates of the first point of the triangle
+    :type p1: tuple | list | p5.Vector
+
+    :param p2: coordinates of the second point of the triangle
+    :type p2: tuple | list | p5.Vector
+
+    :param p3: coordinates of the third point of the triangle
+    :type p3: tuple | list | p5.Vector
+
+    """
+    p5.renderer.triangle(_pack_points(p1, p2, p3))
 
 
 def quad(*args):
@@ -349,20 +494,33 @@ def quad(*args):
     :returns: A quad.
     :rtype: PShape
     """
-    if len(args) == 8:
-        p1, p2, p3, p4 = args[:2], args[2:4], args[4:6], args[6:]
-    elif len(args) == 4:
-        p1, p2, p3, p4 = args
-    else:
+    unpack = _QUAD_ARGS.get(len(args))
+    if unpack is None:
         raise ValueError("Unexpected number of arguments passed to quad()")
 
-    path = [
-        Point(*p1),
-        Point(*p2),
-        Point(*p3),
-        Point(*p4)
-    ]
-    p5.renderer.quad(path)
+    quad_pppp(*unpack(args))
+
+
+def quad_pppp(p1, p2, p3, p4):
+    """Draw a quad given its four corners.
+
+    This skips the argument handling of :func:`quad` and can be called
+    directly when the points are already available.
+
+    :param p1: coordinates of the first point of the quad
+    :type p1: tuple | list | p5.Vector
+
+    :param p2: coordinates of the second point of the quad
+    :type p2: tuple | list | p5.Vector
+
+    :param p3: coordinates of the third point of the quad
+    :type p3: tuple | list | p5.Vector
+
+    :param p4: coordinates of the fourth point of the quad
+    :type p4: tuple | list | p5.Vector
+
+    """
+    p5.renderer.quad(_pack_points(p1, p2, p3, p4))
 
 
 def rect(*args, mode=None):
@@ -404,43 +562,36 @@ def rect(*args, mode=None):
     :rtype: p5.PShape
 
     """
-    if len(args) == 4:
-        coordinate, args = args[:2], args[2:]
-    elif len(args) == 3:
-        coordinate, args = args[0], args[1:]
-    else:
+    unpack = _RECT_ARGS.get(len(args))
+    if unpack is None:
         raise ValueError("Unexpected number of arguments passed to rect()")
+    coordinate, args = unpack(args)
 
     if mode is None:
         mode = _rect_mode
 
+    x, y, z = coordinate[0], coordinate[1], tuple(coordinate[2:])
     if mode == 'CORNER':
-        corner = coordinate
         width, height = args
     elif mode == 'CENTER':
-        center = Point(*coordinate)
         width, height = args
-        corner = Point(center.x - width / 2, center.y - height / 2, center.z)
+        x, y = x - width / 2, y - height / 2
     elif mode == 'RADIUS':
-        center = Point(*coordinate)
         half_width, half_height = args
-        corner = Point(center.x - half_width, center.y - half_height, center.z)
+        x, y = x - half_width, y - half_height
         width = 2 * half_width
         height = 2 * half_height
     elif mode == 'CORNERS':
-        corner = Point(*coordinate)
         corner_2, = args
-        corner_2 = Point(*corner_2)
-        width = corner_2.x - corner.x
-        height = corner_2.y - corner.y
+        width = corner_2[0] - x
+        height = corner_2[1] - y
     else:
         raise ValueError("Unknown rect mode {}".format(mode))
 
-    p1 = Point(*corner)
-    p2 = Point(p1.x + width, p1.y, p1.z)
-    p3 = Point(p2.x, p2.y + height, p2.z)
-    p4 = Point(p1.x, p3.y, p3.z)
-    return quad(p1, p2, p3, p4)
+    quad_pppp((x, y) + z,
+              (x + width, y) + z,
+              (x + width, y + height) + z,
+              (x, y + height) + z)
 
 
 def square(*args, mode=None):
@@ -562,6 +713,14 @@ def arc(*args, mode=None, ellipse_mode=None):
     else:
         emode = ellipse_mode
 
+    center, dim = _ellipse_center_and_radii(coordinate, width, height, emode)
+    p5.renderer.arc(center, dim, start_angle, stop_angle, mode)
+
+
+def _ellipse_center_and_radii(coordinate, width, height, emode):
+    """Return the center and the radii of an ellipse drawn in the given
+    ellipse mode.
+    """
     if emode == 'CORNER':
         corner = Point(*coordinate)
         dim = Point(width / 2, height / 2)
@@ -574,7 +733,7 @@ def arc(*args, mode=None, ellipse_mode=None):
         dim = Point(width, height)
     else:
         raise ValueError("Unknown arc mode {}".format(emode))
-    p5.renderer.arc(center, dim, start_angle, stop_angle, mode)
+    return center, dim
 
 
 def ellipse(*args, mode=None):
@@ -635,8 +794,9 @@ def ellipse(*args, mode=None):
         mode = 'CORNER'
     else:
         width, height = args
-    return arc(coordinate, width, height, 0, math.pi *
-               2, mode='CHORD', ellipse_mode=mode)
+
+    center, dim = _ellipse_center_and_radii(coordinate, width, height, mode)
+    p5.renderer.ellipse(center, dim)
 
 
 def circle(*args, mode=None):
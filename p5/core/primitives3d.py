@@ -69,13 +69,15 @@ def draw_shape(shape, pos=(0, 0, 0)):
     :type pos: tuple | Vector
 
     """
-    p5.renderer.render(shape)
-
-    if isinstance(shape, Geometry):
-        return
-
-    for child_shape in shape.children:
-        draw_shape(child_shape)
+    # Walk the shape tree with an explicit stack (in the same order as
+    # a recursive pre-order traversal) so that deeply nested shapes
+    # don't run into the recursion limit.
+    stack = [shape]
+    while stack:
+        current = stack.pop()
+        p5.renderer.render(current)
+        if not isinstance(current, Geometry):
+            stack.extend(reversed(current.children))
 
 
 @_draw_on_return
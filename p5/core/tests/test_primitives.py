@@ -0,0 +1,220 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from p5.core import p5
+from p5.core import primitives
+from p5.core.constants import ROUND
+from p5.pmath import curves
+from p5.pmath import Vector
+
+
+class TestPackPoints(unittest.TestCase):
+    def setUp(self):
+        self.mode = p5.mode
+
+    def tearDown(self):
+        p5.mode = self.mode
+
+    def test_p2d(self):
+        p5.mode = 'P2D'
+        vertices = primitives._pack_points((1, 2), (3, 4))
+        self.assertEqual(vertices.dtype, np.float32)
+        self.assertEqual(vertices.tolist(), [[1, 2], [3, 4]])
+
+        vertices = primitives._pack_points((1, 2, 3), (4, 5, 6))
+        self.assertEqual(vertices.tolist(), [[1, 2, 3], [4, 5, 6]])
+
+    def test_p3d(self):
+        p5.mode = 'P3D'
+        vertices = primitives._pack_points((1, 2), (3, 4))
+        self.assertEqual(vertices.dtype, np.float32)
+        self.assertEqual(vertices.tolist(), [[1, 2, 0], [3, 4, 0]])
+
+        vertices = primitives._pack_points((1, 2, 3), (4, 5, 6))
+        self.assertEqual(vertices.tolist(), [[1, 2, 3], [4, 5, 6]])
+
+    def test_mixed_points(self):
+        for mode in ['P2D', 'P3D']:
+            p5.mode = mode
+            vertices = primitives._pack_points((1, 2), (3, 4, 5))
+            self.assertEqual(vertices.dtype, np.float32)
+            self.assertEqual(vertices.tolist(), [[1, 2, 0], [3, 4, 5]])
+
+            vertices = primitives._pack_points((1, 2, 3), (4, 5))
+            self.assertEqual(vertices.tolist(), [[1, 2, 3], [4, 5, 0]])
+
+
+class TestPoint(unittest.TestCase):
+    def setUp(self):
+        self.renderer = p5.renderer
+        p5.renderer = mock.Mock(stroke_cap=ROUND, stroke_weight=3)
+
+    def tearDown(self):
+        p5.renderer = self.renderer
+
+    def test_drops_zero_z(self):
+        with mock.patch.object(primitives, 'circle') as circle:
+            primitives.point(1, 2)
+            circle.assert_called_with((1, 2), 1.5, mode='CENTER')
+            primitives.point(1, 2, 0)
+            circle.assert_called_with((1, 2), 1.5, mode='CENTER')
+            primitives.point(1, 2, 3)
+            circle.assert_called_with((1, 2, 3), 1.5, mode='CENTER')
+
+    def test_unknown_stroke_cap(self):
+        p5.renderer.stroke_cap = 'BUTT'
+        with self.assertRaises(ValueError):
+            primitives.point(1, 2)
+
+
+class TestCurves(unittest.TestCase):
+    points_2d = [(30, 20), (80, 5), (80, 75), (30, 75)]
+    points_3d = [(30, 20, 0), (80, 5, 10), (80, 75, -5), (30, 75, 2)]
+
+    def setUp(self):
+        self.renderer = p5.renderer
+        self.mode = p5.mode
+        self.bezier_resolution = curves.bezier_resolution
+        self.curve_resolution = curves.curve_resolution
+        self.curve_tightness = curves.curve_tightness_amount
+        p5.renderer = mock.Mock()
+
+    def tearDown(self):
+        p5.renderer = self.renderer
+        p5.mode = self.mode
+        curves.bezier_detail(self.bezier_resolution)
+        curves.curve_detail(self.curve_resolution)
+        curves.curve_tightness(self.curve_tightness)
+
+    def assertVertices(self, vertices, expected):
+        self.assertEqual(vertices.shape, np.shape(expected))
+        self.assertTrue(np.allclose(vertices, expected, atol=1e-4))
+
+    def test_bezier_matches_bezier_point(self):
+        for mode, points in [('P3D', self.points_3d),
+                             ('P2D', self.points_2d)]:
+            p5.mode = mode
+            for steps in [1, 7, 20]:
+                curves.bezier_detail(steps)
+                primitives.bezier(*points)
+                vertices = p5.renderer.bezier.call_args[0][0]
+                expected = [curves.bezier_point(*points, t)
+                            for t in np.linspace(0, 1, steps + 1)]
+                self.assertVertices(vertices, expected)
+
+    def test_curve_matches_curve_point(self):
+        for mode, points in [('P3D', self.points_3d),
+                             ('P2D', self.points_2d)]:
+            p5.mode = mode
+            for tightness in [0, 0.5]:
+                curves.curve_tightness(tightness)
+                for steps in [1, 7, 20]:
+                    curves.curve_detail(steps)
+                    primitives.curve(*points)
+                    vertices = p5.renderer.curve.call_args[0][0]
+                    expected = [curves.curve_point(*points, t)
+                                for t in np.linspace(0, 1, steps + 1)]
+                    self.assertVertices(vertices, expected)
+
+    def test_curve_follows_basis_matrix(self):
+        p5.mode = 'P2D'
+        primitives.curve(*self.points_2d)
+        matrix = curves.curve_basis_matrix
+        curves.curve_basis_matrix = [[2 * v for v in row] for row in matrix]
+        try:
+            primitives.curve(*self.points_2d)
+            vertices = p5.renderer.curve.call_args[0][0]
+            expected = [curves.curve_point(*self.points_2d, t)
+                        for t in np.linspace(0, 1, curves.curve_resolution + 1)]
+            self.assertVertices(vertices, expected)
+        finally:
+            curves.curve_basis_matrix = matrix
+
+    def test_2d_points_outside_p2d(self):
+        p5.mode = 'P3D'
+        primitives.bezier(*self.points_2d)
+        vertices = p5.renderer.bezier.call_args[0][0]
+        padded = [pt + (0,) for pt in self.points_2d]
+        expected = [curves.bezier_point(*padded, t)
+                    for t in np.linspace(0, 1, curves.bezier_resolution + 1)]
+        self.assertVertices(vertices, expected)
+
+class TestRect(unittest.TestCase):
+    def setUp(self):
+        self.renderer = p5.renderer
+        self.mode = p5.mode
+        p5.renderer = mock.Mock()
+        p5.mode = 'P2D'
+
+    def tearDown(self):
+        p5.renderer = self.renderer
+        p5.mode = self.mode
+
+    def corners(self, *args, **kwargs):
+        primitives.rect(*args, **kwargs)
+        return p5.renderer.quad.call_args[0][0].tolist()
+
+    def test_modes(self):
+        self.assertEqual(self.corners(10, 20, 4, 6, mode='CORNER'),
+                         [[10, 20], [14, 20], [14, 26], [10, 26]])
+        self.assertEqual(self.corners(10, 20, 4, 6, mode='CENTER'),
+                         [[8, 17], [12, 17], [12, 23], [8, 23]])
+        self.assertEqual(self.corners(10, 20, 4, 6, mode='RADIUS'),
+                         [[6, 14], [14, 14], [14, 26], [6, 26]])
+
+    def test_z_coordinate(self):
+        self.assertEqual(self.corners((1, 2, 3), 4, 6, mode='CORNER'),
+                         [[1, 2, 3], [5, 2, 3], [5, 8, 3], [1, 8, 3]])
+        self.assertEqual(self.corners((1, 2, 3), 4, 6, mode='CENTER'),
+                         [[-1, -1, 3], [3, -1, 3], [3, 5, 3], [-1, 5, 3]])
+        self.assertEqual(self.corners((1, 2, 3), 4, 6, mode='RADIUS'),
+                         [[-3, -4, 3], [5, -4, 3], [5, 8, 3], [-3, 8, 3]])
+
+    def test_coordinate_types(self):
+        self.assertEqual(self.corners(Vector(1, 2, 3), 4, 6),
+                         [[1, 2, 3], [5, 2, 3], [5, 8, 3], [1, 8, 3]])
+        self.assertEqual(self.corners(np.array([1.0, 2.0]), 4, 6),
+                         [[1, 2], [5, 2], [5, 8], [1, 8]])
+        self.assertEqual(self.corners(np.array([1.0, 2.0, 3.0]), 4, 6),
+                         [[1, 2, 3], [5, 2, 3], [5, 8, 3], [1, 8, 3]])
+
+    def test_corners_computed_in_double_precision(self):
+        x, y, w, h = 100000.3, 7.1, 0.01, 0.02
+        expected = np.array([(x, y), (x + w, y), (x + w, y + h), (x, y + h)],
+                            dtype=np.float32)
+        self.assertEqual(self.corners(x, y, w, h), expected.tolist())
+    def test_argument_counts(self):
+        self.assertEqual(self.corners((10, 20), 4, 6),
+                         self.corners(10, 20, 4, 6))
+        for args in [(), (1, 2), (1, 2, 3, 4, 5)]:
+            with self.assertRaises(ValueError):
+                primitives.rect(*args)
+
+
+class TestQuad(unittest.TestCase):
+    def setUp(self):
+        self.renderer = p5.renderer
+        self.mode = p5.mode
+        p5.renderer = mock.Mock()
+        p5.mode = 'P2D'
+
+    def tearDown(self):
+        p5.renderer = self.renderer
+        p5.mode = self.mode
+
+    def test_argument_counts(self):
+        expected = [[0, 0], [1, 0], [1, 1], [0, 1]]
+        primitives.quad(0, 0, 1, 0, 1, 1, 0, 1)
+        self.assertEqual(p5.renderer.quad.call_args[0][0].tolist(), expected)
+        primitives.quad((0, 0), (1, 0), (1, 1), (0, 1))
+        self.assertEqual(p5.renderer.quad.call_args[0][0].tolist(), expected)
+
+        for args in [(), (1, 2), (1, 2, 3, 4, 5, 6)]:
+            with self.assertRaises(ValueError):
+                primitives.quad(*args)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import sys
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from p5.core import p5
+from p5.core import primitives3d
+
+
+def node(name, *children):
+    return SimpleNamespace(name=name, children=list(children))
+
+
+def chain(depth):
+    shape = node(depth - 1)
+    for name in reversed(range(depth - 1)):
+        shape = node(name, shape)
+    return shape
+
+
+# Children are drawn after their parent, in order.
+tree = node('a', node('b', node('c'), node('d')), node('e', node('f')))
+
+
+class TestDrawShape(unittest.TestCase):
+    def setUp(self):
+        self.renderer = p5.renderer
+        p5.renderer = mock.Mock()
+
+    def tearDown(self):
+        p5.renderer = self.renderer
+
+    def drawn(self):
+        return [args[0].name for args, _ in
+                p5.renderer.render.call_args_list]
+
+    def test_pre_order(self):
+        primitives3d.draw_shape(tree)
+        self.assertEqual(self.drawn(), ['a', 'b', 'c', 'd', 'e', 'f'])
+
+    def test_deep_nesting(self):
+        depth = sys.getrecursionlimit() + 100
+        primitives3d.draw_shape(chain(depth))
+        self.assertEqual(self.drawn(), list(range(depth)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import sys
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from p5.core import p5
+import builtins
+builtins.current_renderer = "vispy"
+# The 2D renderer reads its shaders for the current mode on import.
+p5.mode = 'P2D'
+from p5.sketch.Vispy2DRenderer.renderer2d import VispyRenderer2D
+from p5.sketch.Vispy2DRenderer.openglrenderer import to_homogeneous
+p5.mode = 'P3D'
+
+from .test_primitives3d import chain, tree
+
+
+class TestToHomogeneous(unittest.TestCase):
+    def test_2d_vertices(self):
+        vertices = np.array([(1, 2), (3, 4)], dtype=np.float32)
+        self.assertEqual(to_homogeneous(vertices).tolist(),
+                         [[1, 2, 0, 1], [3, 4, 0, 1]])
+
+    def test_3d_vertices(self):
+        vertices = [(1, 2, 3), (4, 5, 6)]
+        self.assertEqual(to_homogeneous(vertices).tolist(),
+                         [[1, 2, 3, 1], [4, 5, 6, 1]])
+
+
+class TestFlushGeometry(unittest.TestCase):
+    def setUp(self):
+        self.renderer = VispyRenderer2D()
+        self.calls = mock.Mock()
+        self.renderer.render_default = self.calls.render_default
+        self.renderer.render_line = self.calls.render_line
+
+    def flush(self, queue):
+        self.renderer.draw_queue = list(queue)
+        self.renderer.flush_geometry()
+        self.assertEqual(self.renderer.draw_queue, [])
+        return self.calls.mock_calls
+
+    def test_batches_consecutive_shapes(self):
+        calls = self.flush([('triangles', 'a'), ('triangles', 'b'),
+                            ('lines', 'c'), ('lines', 'd'),
+                            ('triangles', 'e')])
+        self.assertEqual(calls, [
+            mock.call.render_default('triangles', ['a', 'b']),
+            mock.call.render_line(['c', 'd']),
+            mock.call.render_default('triangles', ['e']),
+        ])
+
+    def test_does_not_batch_strips(self):
+        calls = self.flush([('triangle_strip', 'a'),
+                            ('triangle_strip', 'b'),
+                            ('triangles', 'c')])
+        self.assertEqual(calls, [
+            mock.call.render_default('triangle_strip', ['a']),
+            mock.call.render_default('triangle_strip', ['b']),
+            mock.call.render_default('triangles', ['c']),
+        ])
+
+    def test_fill_and_stroke_are_not_batched(self):
+        # With both fill and stroke every shape queues its fill and
+        # then its stroke, so the types alternate.
+        calls = self.flush([('triangles', 'a'), ('lines', 'b'),
+                            ('triangles', 'c'), ('lines', 'd')])
+        self.assertEqual(calls, [
+            mock.call.render_default('triangles', ['a']),
+            mock.call.render_line(['b']),
+            mock.call.render_default('triangles', ['c']),
+            mock.call.render_line(['d']),
+        ])
+
+
+
+class TestPrimitiveShapes(unittest.TestCase):
+    def test_vertex_arrays_are_not_copied(self):
+        renderer = VispyRenderer2D()
+        renderer.render_shape = mock.Mock()
+        vertices = np.zeros((2, 2), dtype=np.float32)
+        # The shape picks up its default style from the current renderer.
+        with mock.patch.object(p5, 'renderer', renderer):
+            renderer.line(vertices)
+        shape, = renderer.render_shape.call_args[0]
+        self.assertIs(shape.vertices, vertices)
+
+
+class TestRenderShape(unittest.TestCase):
+    def setUp(self):
+        self.renderer = VispyRenderer2D()
+        self.renderer.render = mock.Mock()
+
+    def rendered(self):
+        return [args[0].name for args, _ in
+                self.renderer.render.call_args_list]
+
+    def test_pre_order(self):
+        self.renderer.render_shape(tree)
+        self.assertEqual(self.rendered(), ['a', 'b', 'c', 'd', 'e', 'f'])
+
+    def test_deep_nesting(self):
+        depth = sys.getrecursionlimit() + 100
+        self.renderer.render_shape(chain(depth))
+        self.assertEqual(self.rendered(), list(range(depth)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,15 @@
 import unittest
 import numpy as np
 
-from p5.sketch.Vispy2DRenderer.shape import PShape
+from p5.sketch.Vispy2DRenderer import shape
+from p5.sketch.Vispy2DRenderer.shape import PShape, Arc, Ellipse
+from p5.core import p5
 from p5.core.color import Color
 from p5.pmath import PI
+import builtins
+builtins.current_renderer = "vispy"
+p5.mode = 'P3D'
+from p5.sketch.Vispy3DRenderer.renderer3d import Renderer3D
 
 vertices = [(0, 0), (1, 0), (1, 1), (0, 1)]
 
@@ -28,6 +34,21 @@ class TestPShape(unittest.TestCase):
         self.assertEqual(quad._stroke_cap, 1)
         self.assertEqual(quad._stroke_join, 1)
 
+    def test_array_vertices(self):
+        vertices = np.zeros((4, 3), dtype=np.float32)
+        pshape = PShape(vertices=vertices, fill_color=Color(255),
+                        stroke_color=Color(0), stroke_weight=2,
+                        stroke_join=1, stroke_cap=1)
+        self.assertIsInstance(pshape.vertices, np.ndarray)
+        self.assertIsNot(pshape.vertices, vertices)
+
+        vertices[0] = (1, 2, 3)
+        self.assertEqual(pshape.vertices[0].tolist(), [0, 0, 0])
+
+        with pshape.edit(reset=False):
+            pshape.add_vertex((1, 1, 0))
+        self.assertEqual(len(pshape.vertices), 5)
+
     def test_transforms(self):
         quad.translate(100, 100, 100)
         self.assertTrue(np.array_equal(
@@ -107,5 +128,115 @@ class TestPShape(unittest.TestCase):
         quad.reset_matrix()
 
 
+class TestArc(unittest.TestCase):
+    def setUp(self):
+        self.renderer = p5.renderer
+        p5.renderer = Renderer3D()
+
+    def tearDown(self):
+        p5.renderer = self.renderer
+
+    def test_vertices_on_ellipse(self):
+        arc = Arc((10, 20, 0), (30, 15), 0, PI, 'OPEN')
+        vertices = np.asarray(arc.vertices)
+        self.assertEqual(vertices.shape[1], 3)
+        self.assertTrue(np.allclose(
+            ((vertices[:, 0] - 10) / 30) ** 2 + ((vertices[:, 1] - 20) / 15) ** 2,
+            1, atol=1e-5))
+        self.assertTrue(np.allclose(vertices[0], (40, 20, 0), atol=1e-4))
+        self.assertTrue(np.allclose(vertices[-1], (-20, 20, 0), atol=1e-4))
+
+    def test_modes(self):
+        pie = np.asarray(Arc((0, 0, 0), (10, 10), 0, PI / 2, 'PIE').vertices)
+        self.assertTrue(np.allclose(pie[0], (0, 0, 0)))
+        self.assertTrue(np.allclose(pie[-1], pie[0]))
+
+        chord = np.asarray(Arc((0, 0, 0), (10, 10), 0, PI / 2, 'CHORD').vertices)
+        self.assertTrue(np.allclose(chord[0], (10, 0, 0)))
+        self.assertTrue(np.allclose(chord[-1], chord[0]))
+
+        fan = np.asarray(Arc((0, 0, 0), (10, 10), 0, PI / 2, None).vertices)
+        self.assertTrue(np.allclose(fan[0], (0, 0, 0)))
+        self.assertTrue(np.allclose(fan[-1], (0, 10, 0), atol=1e-4))
+
+    def test_accuracy_follows_transform(self):
+        small = Arc((0, 0, 0), (50, 50), 0, 2 * PI, 'OPEN')
+        p5.renderer.transform_matrix = np.diag([4.0, 4.0, 1.0, 1.0])
+        large = Arc((0, 0, 0), (50, 50), 0, 2 * PI, 'OPEN')
+        self.assertGreater(len(large.vertices), len(small.vertices))
+
+    def test_evenly_spaced_vertices(self):
+        # Small shapes use the fewest subdivisions, which don't divide
+        # the table evenly.
+        for pshape in [Ellipse((0, 0, 0), (5, 5)),
+                       Arc((0, 0, 0), (5, 5), 0, 2 * PI, 'OPEN'),
+                       Arc((0, 0, 0), (5, 5), 0.3, 2.2, 'OPEN')]:
+            angles = np.unwrap(np.arctan2(pshape.vertices[:, 1],
+                                          pshape.vertices[:, 0]))
+            segments = np.diff(angles)
+            self.assertLess(segments.max() - segments.min(), 1e-2)
+
+    def test_accuracy_ignores_translation(self):
+        shape._arc_acc.cache_clear()
+        for tx, ty in [(0, 0), (100, 50), (-30, 7)]:
+            tm = np.identity(4)
+            tm[:2, 3] = tx, ty
+            p5.renderer.transform_matrix = tm
+            Ellipse((0, 0, 0), (50, 50))
+        info = shape._arc_acc.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 2)
+
+    def test_accuracy_with_float32_transform(self):
+        p5.renderer.transform_matrix = np.diag([4.0, 4.0, 1.0, 1.0])
+        expected = Arc((0, 0, 0), (50, 50), 0, 2 * PI, 'OPEN').vertices
+        p5.renderer.transform_matrix = np.diag(
+            [4.0, 4.0, 1.0, 1.0]).astype(np.float32)
+        vertices = Arc((0, 0, 0), (50, 50), 0, 2 * PI, 'OPEN').vertices
+        self.assertEqual(len(vertices), len(expected))
+
+    def test_ellipse_matches_arc(self):
+        ellipse = Ellipse((5, 7, 0), (40, 25))
+        arc = Arc((5, 7, 0), (40, 25), 0, 2 * PI, 'CHORD')
+        self.assertEqual(ellipse.arc_mode, 'CHORD')
+        # The arc repeats its first vertex both as the stop point and
+        # when closing the chord, the ellipse only closes once.
+        self.assertTrue(np.allclose(ellipse.vertices, arc.vertices[:-1],
+                                    atol=1e-4))
+
+    def test_kernel_is_opt_in(self):
+        self.assertIsNone(shape._arc_vertices)
+
+    def test_kernel_matches_numpy(self):
+        if not shape.use_arc_kernel():
+            self.skipTest("numba is not installed")
+        try:
+            for mode in ['OPEN', 'CHORD', 'PIE', None]:
+                compiled = Arc((5, 7, 0), (40, 25), -1, 2.5, mode).vertices
+                shape.use_arc_kernel(False)
+                fallback = Arc((5, 7, 0), (40, 25), -1, 2.5, mode).vertices
+                shape.use_arc_kernel()
+                self.assertTrue(np.allclose(compiled, fallback, atol=1e-4))
+                self.assertEqual(compiled.dtype, np.float32)
+                self.assertEqual(fallback.dtype, np.float32)
+        finally:
+            shape.use_arc_kernel(False)
+
+    def test_ellipse_kernel_matches_numpy(self):
+        if not shape.use_arc_kernel():
+            self.skipTest("numba is not installed")
+        try:
+            for radii in [(40, 25), (400, 250), (1, 1)]:
+                compiled = Ellipse((5, 7, 0), radii).vertices
+                shape.use_arc_kernel(False)
+                fallback = Ellipse((5, 7, 0), radii).vertices
+                shape.use_arc_kernel()
+                self.assertEqual(compiled.shape, fallback.shape)
+                self.assertTrue(np.allclose(compiled, fallback, atol=1e-4))
+                self.assertEqual(compiled.dtype, np.float32)
+        finally:
+            shape.use_arc_kernel(False)
+
+
 if __name__ == "__main__":
     unittest.main()
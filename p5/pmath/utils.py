@@ -56,9 +56,11 @@ TAU = 2 * math.pi
 HALF_TAU = math.pi
 
 # We will be using these a lot, just precompute a whole lot of sin and
-# cosine values.
-SINCOS_PRECISION = 0.5
-SINCOS_LENGTH = int(360 / SINCOS_PRECISION)
+# cosine values. The table length is a power of two so that indices
+# can be wrapped around with `idx & SINCOS_MASK` instead of a modulo.
+SINCOS_LENGTH = 1 << 12
+SINCOS_PRECISION = 360 / SINCOS_LENGTH
+SINCOS_MASK = SINCOS_LENGTH - 1
 
 PRE_SIN = [sin(radians(d) * SINCOS_PRECISION) for d in range(SINCOS_LENGTH)]
 PRE_COS = [cos(radians(d) * SINCOS_PRECISION) for d in range(SINCOS_LENGTH)]
@@ -0,0 +1,98 @@
+#
+# Part of p5: A Python package based on Processing
+# Copyright (C) 2017-2019 Abhik Pal
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+# General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+"""Compiled tessellation kernels for shapes.
+
+This module needs numba. It is only imported when the kernels are
+turned on with :func:`p5.sketch.Vispy2DRenderer.shape.use_arc_kernel`.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def arc_vertices(c1x, c1y, rx, ry, start_index, end_index, steps,
+                 sincos, mask, include_center, close):
+    """Generate the vertices of an arc from a (sin, cos) lookup table.
+
+    :param c1x: x-coordinate of the center of the arc.
+    :type c1x: float
+
+    :param c1y: y-coordinate of the center of the arc.
+    :type c1y: float
+
+    :param rx: x-radius of the arc.
+    :type rx: float
+
+    :param ry: y-radius of the arc.
+    :type ry: float
+
+    :param start_index: Index of the start angle in the lookup table.
+    :type start_index: int
+
+    :param end_index: Index of the stop angle in the lookup table.
+    :type end_index: int
+
+    :param steps: Number of segments the arc is split into. The
+        vertices are spread evenly between the start and stop index.
+    :type steps: int
+
+    :param sincos: (N, 2) table of (sin, cos) values.
+    :type sincos: np.ndarray
+
+    :param mask: Bit mask used to wrap indices into the table (N must
+        be a power of two and mask == N - 1)
+    :type mask: int
+
+    :param include_center: Toggles whether the first vertex is the
+        center of the arc.
+    :type include_center: bool
+
+    :param close: Toggles whether the first vertex is repeated at the
+        end of the arc.
+    :type close: bool
+
+    :returns: (N, 3) array of arc vertices.
+    :rtype: np.ndarray
+
+    """
+    span = end_index - start_index
+    out = np.empty((steps + 1 + include_center + close, 3), np.float32)
+
+    j = 0
+    if include_center:
+        out[0, 0] = c1x
+        out[0, 1] = c1y
+        out[0, 2] = 0
+        j = 1
+
+    for k in range(steps):
+        i = (start_index + span * k // steps) & mask
+        out[j, 0] = c1x + rx * sincos[i, 1]
+        out[j, 1] = c1y + ry * sincos[i, 0]
+        out[j, 2] = 0
+        j += 1
+
+    i = end_index & mask
+    out[j, 0] = c1x + rx * sincos[i, 1]
+    out[j, 1] = c1y + ry * sincos[i, 0]
+    out[j, 2] = 0
+
+    if close:
+        out[j + 1] = out[0]
+    return out
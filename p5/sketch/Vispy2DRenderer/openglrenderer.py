@@ -20,6 +20,18 @@ def to_3x3(mat):
     return mat[:3, :3]
 
 
+def to_homogeneous(vertices):
+    """Returns the (N, 4) homogeneous coordinates of (N, 2) or (N, 3) vertices
+
+    Missing z-coordinates are set to 0.
+    """
+    vertices = np.asarray(vertices)
+    hvertices = np.zeros((len(vertices), 4))
+    hvertices[:, :vertices.shape[1]] = vertices
+    hvertices[:, 3] = 1
+    return hvertices
+
+
 def _tess_new_contour(vertices):
     """Given a list of vertices, evoke gluTess to create a contour
     """
@@ -351,4 +363,6 @@ class OpenGLRenderer(ABC):
         self.fbuffer.delete()
 
     def _transform_vertices(self, vertices, local_matrix, global_matrix):
-        return np.dot(np.dot(vertices, local_matrix.T), global_matrix.T)[:, :3]
+        # Combine the two 4x4 matrices first so that the (N, 4) vertex
+        # array only goes through a single matrix product.
+        return np.dot(vertices, global_matrix.dot(local_matrix).T)[:, :3]
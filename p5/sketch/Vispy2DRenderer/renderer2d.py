@@ -31,9 +31,14 @@ from vispy.gloo import VertexBuffer
 from contextlib import contextmanager
 from .shaders2d import src_texture
 from .shaders2d import src_line
-from .openglrenderer import OpenGLRenderer, get_render_primitives, COLOR_WHITE
+from .openglrenderer import OpenGLRenderer, get_render_primitives, COLOR_WHITE, to_homogeneous
 from p5.core.constants import SType
-from .shape import PShape, Arc
+from .shape import PShape, Arc, Ellipse
+
+# Shape types whose primitives are independent of each other and can
+# be merged into a single draw call. Strips and fans can't be merged
+# since their vertices would get connected across shapes.
+BATCHED_SHAPE_TYPES = {'lines', 'triangles', 'points'}
 
 
 class VispyRenderer2D(OpenGLRenderer):
@@ -167,7 +172,7 @@ class VispyRenderer2D(OpenGLRenderer):
             stype, vertices, idx = obj
             # Transform vertices
             vertices = self._transform_vertices(
-                np.hstack([vertices, np.ones((len(vertices), 1))]),
+                to_homogeneous(vertices),
                 shape._matrix,
                 self.transform_matrix)
             # Add to draw queue
@@ -183,21 +188,39 @@ class VispyRenderer2D(OpenGLRenderer):
 
     def flush_geometry(self):
         """Flush all the shape geometry from the draw queue to the GPU.
+
+        Runs of consecutive shapes of a batchable type are sent to the
+        GPU together with a single draw call. Shapes are still drawn in
+        the order in which they were added to the queue.
+
+        A shape with both a fill and a stroke queues its fill triangles
+        followed by its stroke lines, so consecutive entries never
+        share a type and nothing is batched. Batching only kicks in
+        for sketches that use `no_stroke()` or `no_fill()`.
         """
+        current_shape = None
         current_queue = []
-        for index, shape in enumerate(self.draw_queue):
-            current_shape = self.draw_queue[index][0]
-            current_queue.append(self.draw_queue[index][1])
-
-            if current_shape == "lines":
-                self.render_line(current_queue)
-            else:
-                self.render_default(current_shape, current_queue)
+        for shape_type, shape_data in self.draw_queue:
+            if current_queue and (shape_type != current_shape or
+                                  shape_type not in BATCHED_SHAPE_TYPES):
+                self._render_queue(current_shape, current_queue)
+                current_queue = []
+            current_shape = shape_type
+            current_queue.append(shape_data)
 
-            current_queue = []
+        if current_queue:
+            self._render_queue(current_shape, current_queue)
 
         self.draw_queue = []
 
+    def _render_queue(self, shape_type, queue):
+        """Draw a queue of shapes that all have the same type.
+        """
+        if shape_type == "lines":
+            self.render_line(queue)
+        else:
+            self.render_default(shape_type, queue)
+
     def render_line(self, queue):
         '''
         This rendering algorithm works by tesselating the line into
@@ -341,29 +364,41 @@ class VispyRenderer2D(OpenGLRenderer):
         self.line_prog.delete()
 
     def render_shape(self, shape):
-        self.render(shape)
-        for child_shape in shape.children:
-            self.render_shape(child_shape)
+        stack = [shape]
+        while stack:
+            current = stack.pop()
+            self.render(current)
+            stack.extend(reversed(current.children))
+
+    def _render_vertex_array(self, vertices, shape_type):
+        """Render a vertex array generated by the primitives.
+
+        The array is owned by the renderer, so it is handed to the
+        shape as is instead of being copied by PShape.
+        """
+        shape = PShape(shape_type=shape_type)
+        shape.vertices = vertices
+        self.render_shape(shape)
 
     def line(self, *args):
         path = args[0]
-        self.render_shape(PShape(vertices=path, shape_type=SType.LINES))
+        self._render_vertex_array(path, SType.LINES)
 
     def bezier(self, *args):
         vertices = args[0]
-        self.render_shape(PShape(vertices=vertices, shape_type=SType.LINE_STRIP))
+        self._render_vertex_array(vertices, SType.LINE_STRIP)
 
     def curve(self, *args):
         vertices = args[0]
-        self.render_shape(PShape(vertices=vertices, shape_type=SType.LINE_STRIP))
+        self._render_vertex_array(vertices, SType.LINE_STRIP)
 
     def triangle(self, *args):
         path = args[0]
-        self.render_shape(PShape(vertices=path, shape_type=SType.TRIANGLES))
+        self._render_vertex_array(path, SType.TRIANGLES)
 
     def quad(self, *args):
         path = args[0]
-        self.render_shape(PShape(vertices=path, shape_type=SType.QUADS))
+        self._render_vertex_array(path, SType.QUADS)
 
     def arc(self, *args):
         center = args[0]
@@ -374,6 +409,12 @@ class VispyRenderer2D(OpenGLRenderer):
 
         self.render_shape(Arc(center, dim, start_angle, stop_angle, mode))
 
+    def ellipse(self, *args):
+        center = args[0]
+        dim = args[1]
+
+        self.render_shape(Ellipse(center, dim))
+
     def shape(self, vertices, contours, shape_type, *args):
         """Draws the shape made using begin_shape and end_shape"""
         self.render_shape(PShape(vertices=vertices, contours=contours, shape_type=shape_type))
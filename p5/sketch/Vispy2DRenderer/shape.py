@@ -28,10 +28,10 @@ from p5.core.color import Color
 from p5.core.constants import SType
 from p5.pmath import matrix
 from p5.pmath.vector import Point
-from p5.pmath.utils import SINCOS
+from p5.pmath.utils import SINCOS_LENGTH, SINCOS_MASK, PRE_SIN, PRE_COS
 from p5.core import p5
 
-__all__ = ['PShape']
+__all__ = ['PShape', 'use_arc_kernel']
 
 
 def _ensure_editable(func):
@@ -80,7 +80,8 @@ def _call_on_children(func):
 class PShape:
     """Custom shape class for p5.
 
-    :param vertices: List of (polygonal) vertices for the shape.
+    :param vertices: List of (polygonal) vertices for the shape. An
+        (N, 2) or (N, 3) array is copied and kept as an array.
     :type vertices: list | np.ndarray
 
     :param fill_color: Fill color of the shape (default: 'auto' i.e.,
@@ -128,7 +129,12 @@ class PShape:
         self.children = children or []
         self.visible = visible
 
-        self.vertices = list(vertices)
+        # Vertex arrays are copied as arrays to avoid a round trip
+        # through Python tuples.
+        if isinstance(vertices, np.ndarray):
+            self.vertices = np.array(vertices)
+        else:
+            self.vertices = list(vertices)
         self.shape_type = shape_type
         self.contours = [list(c) for c in contours]  # List of all contours
 
@@ -218,6 +224,8 @@ class PShape:
         if reset:
             self.vertices = []
             self.contours = []
+        elif isinstance(self.vertices, np.ndarray):
+            self.vertices = list(self.vertices)
         self._in_edit_mode = True
         yield
         self._in_edit_mode = False
@@ -451,6 +459,91 @@ MIN_POINT_ACCURACY = 20
 MAX_POINT_ACCURACY = 200
 POINT_ACCURACY_FACTOR = 10
 
+_TWO_PI = math.pi * 2
+_SIZE_TO_ACCURACY = _TWO_PI / POINT_ACCURACY_FACTOR
+
+# Converts an angle (in radians) to an index into the sin/cos table.
+_ANGLE_SCALE = SINCOS_LENGTH / _TWO_PI
+
+# (sin, cos) lookup table as an array so that arc vertices can be
+# gathered in one go instead of one Python tuple at a time. The sine
+# and cosine of an angle are interleaved (row `i` is (sin_i, cos_i))
+# so that each lookup reads a single 8-byte pair.
+_SINCOS_ARR = np.ascontiguousarray(np.stack([PRE_SIN, PRE_COS], axis=1),
+                                   dtype=np.float32)
+
+# Compiled arc tessellation kernel, only set by use_arc_kernel().
+_arc_vertices = None
+
+
+def use_arc_kernel(enable=True):
+    """Toggle tessellating arcs and ellipses with a compiled numba kernel.
+
+    The kernel is loaded and compiled here, on demand, so that sketches
+    which don't use it never import numba. This is exposed to sketches
+    as :func:`p5.use_arc_kernel`.
+
+    :param enable: Toggles the compiled kernel (default: True)
+    :type enable: bool
+
+    :returns: Whether the compiled kernel is used. This is False when
+        numba isn't installed.
+    :rtype: bool
+
+    """
+    global _arc_vertices
+    _arc_vertices = None
+    if not enable:
+        return False
+
+    try:
+        from ._shape_kernels import arc_vertices
+    except ImportError:
+        return False
+
+    # Compile the kernel now instead of on the first arc.
+    arc_vertices(0.0, 0.0, 1.0, 1.0, 0, 1, 1, _SINCOS_ARR, SINCOS_MASK,
+                 True, True)
+    _arc_vertices = arc_vertices
+    return True
+
+
+def _matrix_key(tm):
+    """Return the cache key of a transform matrix for _arc_acc().
+
+    Only the part of the matrix that acts on the radii is kept, so that
+    shapes drawn after a translation still hit the cache.
+    """
+    return np.asarray(tm[:3, :2], dtype=np.float64).tobytes()
+
+
+@functools.lru_cache(maxsize=256)
+def _arc_acc(tm_key, rx, ry):
+    """Return the number of subdivisions for an arc with the given radii.
+
+    The screen space size of the arc is the length of the transformed
+    radius vector, so it doesn't depend on the center of the arc or on
+    any translation. It is cached for the float64 bytes of the upper
+    left 3x2 block of the current transform matrix (see _matrix_key()).
+    """
+    tm = np.frombuffer(tm_key, dtype=np.float64).reshape(3, 2)
+    (xx, xy), (yx, yy), (zx, zy) = tm.tolist()
+    dx = xx * rx + xy * ry
+    dy = yx * rx + yy * ry
+    dz = zx * rx + zy * ry
+    size_acc = math.sqrt(dx * dx + dy * dy + dz * dz) * _SIZE_TO_ACCURACY
+    return min(MAX_POINT_ACCURACY, max(MIN_POINT_ACCURACY, int(size_acc)))
+
+
+@functools.lru_cache(maxsize=None)
+def _full_turn_sincos(acc):
+    """Return the (sin, cos) pairs of `acc` evenly spaced angles around
+    a full turn.
+    """
+    sc = _SINCOS_ARR[np.arange(acc) * SINCOS_LENGTH // acc]
+    sc.flags.writeable = False
+    return sc
+
 
 class Arc(PShape):
     def __init__(self, center, radii, start_angle, stop_angle,
@@ -470,44 +563,88 @@ class Arc(PShape):
                          stroke_join=stroke_join, stroke_cap=stroke_cap, shape_type=gl_type, **kwargs)
         self._tessellate()
 
+    def _tessellation_params(self):
+        """Return the center, the radii and the number of subdivisions
+        used to tessellate the arc.
+        """
+        c1x = float(self._center[0])
+        c1y = float(self._center[1])
+        rx = float(self._radii[0])
+        ry = float(self._radii[1])
+        acc = _arc_acc(_matrix_key(p5.renderer.transform_matrix), rx, ry)
+        return c1x, c1y, rx, ry, acc
+
+    def _tessellate(self):
+        """Generate vertex and face data using radii.
+        """
+        c1x, c1y, rx, ry, acc = self._tessellation_params()
+
+        # Bind everything used more than once to locals.
+        mode = self.arc_mode
+        sincos = _SINCOS_ARR
+
+        start_index = int(self._start_angle * _ANGLE_SCALE)
+        end_index = int(self._stop_angle * _ANGLE_SCALE)
+
+        # Spread the vertices evenly over the arc, a fixed stride
+        # through the table would leave a sliver for the last segment.
+        span = end_index - start_index
+        steps = max(1, round(span * acc / SINCOS_LENGTH)) if span > 0 else 0
+
+        include_center = mode in ['PIE', None]
+        close = mode in ['CHORD', 'PIE']
+
+        if _arc_vertices is not None:
+            self.vertices = _arc_vertices(c1x, c1y, rx, ry,
+                                          start_index, end_index, steps,
+                                          sincos, SINCOS_MASK,
+                                          include_center, close)
+            return
+
+        idxs = np.arange(steps) * span // (steps or 1) + start_index
+        idxs = np.append(idxs, end_index)
+        sc = sincos[idxs & SINCOS_MASK]
+
+        first = int(include_center)
+        last = first + len(sc)
+        vertices = np.zeros((last + close, 3), dtype=np.float32)
+        vertices[first:last, 0] = c1x + rx * sc[:, 1]
+        vertices[first:last, 1] = c1y + ry * sc[:, 0]
+        if include_center:
+            vertices[0, :2] = c1x, c1y
+        if close:
+            vertices[-1] = vertices[0]
+        self.vertices = vertices
+
+
+class Ellipse(Arc):
+    """A full ellipse.
+
+    This is an arc from 0 to 2 * pi in 'CHORD' mode, but tessellating
+    it doesn't need any of the start/stop angle handling of arcs.
+    """
+
+    def __init__(self, center, radii, **kwargs):
+        super().__init__(center, radii, 0, _TWO_PI, mode='CHORD', **kwargs)
+
     def _tessellate(self):
         """Generate vertex and face data using radii.
         """
-        rx = self._radii[0]
-        ry = self._radii[1]
-
-        c1x = self._center[0]
-        c1y = self._center[1]
-        s1 = p5.renderer.transform_matrix.dot(np.array([c1x, c1y, 0, 1]))
-
-        c2x = c1x + rx
-        c2y = c1y + ry
-        s2 = p5.renderer.transform_matrix.dot(np.array([c2x, c2y, 0, 1]))
-
-        sdiff = (s2 - s1)
-        size_acc = (np.sqrt(np.sum(sdiff * sdiff)) *
-                    math.pi * 2) / POINT_ACCURACY_FACTOR
-
-        acc = min(MAX_POINT_ACCURACY, max(MIN_POINT_ACCURACY, int(size_acc)))
-        inc = int(len(SINCOS) / acc)
-
-        sclen = len(SINCOS)
-        start_index = int((self._start_angle / (math.pi * 2)) * sclen)
-        end_index = int((self._stop_angle / (math.pi * 2)) * sclen)
-
-        vertices = [(c1x, c1y, 0)] if self.arc_mode in ['PIE', None] else []
-        for idx in range(start_index, end_index, inc):
-            i = idx % sclen
-            vertices.append((
-                c1x + rx * SINCOS[i][1],
-                c1y + ry * SINCOS[i][0],
-                0
-            ))
-        vertices.append((
-            c1x + rx * SINCOS[end_index % sclen][1],
-            c1y + ry * SINCOS[end_index % sclen][0],
-            0
-        ))
-        if self.arc_mode == 'CHORD' or self.arc_mode == 'PIE':
-            vertices.append(vertices[0])
+        c1x, c1y, rx, ry, acc = self._tessellation_params()
+
+        if _arc_vertices is not None:
+            # The stop point of the full turn wraps around to the
+            # start and closes the ellipse.
+            self.vertices = _arc_vertices(c1x, c1y, rx, ry,
+                                          0, SINCOS_LENGTH, acc,
+                                          _SINCOS_ARR, SINCOS_MASK,
+                                          False, False)
+            return
+
+        sc = _full_turn_sincos(acc)
+        vertices = np.empty((len(sc) + 1, 3), dtype=np.float32)
+        vertices[:-1, 0] = c1x + rx * sc[:, 1]
+        vertices[:-1, 1] = c1y + ry * sc[:, 0]
+        vertices[:, 2] = 0
+        vertices[-1] = vertices[0]
         self.vertices = vertices
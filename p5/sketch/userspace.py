@@ -31,7 +31,8 @@ from ..core import p5
 from ..pmath import matrix
 
 __all__ = ['no_loop', 'loop', 'redraw', 'size', 'title', 'no_cursor',
-           'cursor', 'exit', 'draw', 'setup', 'run', 'save_frame', 'save']
+           'cursor', 'exit', 'draw', 'setup', 'run', 'save_frame', 'save',
+           'use_arc_kernel']
 
 builtins.width = 360
 builtins.height = 360
@@ -343,3 +344,25 @@ def save_frame(filename="screen.png"):
     # saved image (instead of using the default sequencing) --abhikpal
     # (2018-08-14)
     p5.sketch.queue_screenshot(filename)
+
+
+def use_arc_kernel(enable=True):
+    """Toggle tessellating arcs, ellipses and circles with a compiled
+    numba kernel.
+
+    The kernel is faster than the default numpy code for each shape,
+    but importing numba and compiling the kernel is slow. It only pays
+    off for sketches that draw very many arcs or ellipses, so it is off
+    by default. Call this in `setup()` so that the kernel is ready
+    before the first frame is drawn.
+
+    :param enable: Toggles the compiled kernel (default: True)
+    :type enable: bool
+
+    :returns: Whether the compiled kernel is used. This is False when
+        numba isn't installed.
+    :rtype: bool
+
+    """
+    from p5.sketch.Vispy2DRenderer import shape
+    return shape.use_arc_kernel(enable)